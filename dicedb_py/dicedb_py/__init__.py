@@ -5,7 +5,7 @@ dicedb-py
 Python client for DiceDB.
 """
 
-from .client import Client, WithID
+from .client import Client, WithID, WithThreadSafe, WithUnixSocket
 
 __version__ = "1.0.4"
-__all__ = ["Client", "WithID"]
\ No newline at end of file
+__all__ = ["Client", "WithID", "WithThreadSafe", "WithUnixSocket"]
\ No newline at end of file
@@ -1,17 +1,28 @@
 """
 DiceDB client for Python.
 """
+import contextlib
+import os
 import socket
 import threading
 import uuid
 import time
 import io
-from typing import List, Dict, Callable, Optional, Tuple, Any, Union
+from collections import deque
+from typing import List, Dict, Callable, Optional, Sequence, Tuple, Any, Union
 
 from . import io as dice_io
 from .wire import Command, Response, ValueType
 
 
+CONNECT_TIMEOUT = 5  # seconds, for connecting and the handshake only
+SOCKET_BUFFER_SIZE = 256 * 1024  # 256 KB
+UNIX_SOCKET_PATH = "/var/run/dicedb.sock"
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+WATCH_RING_SIZE = 1024  # must be a power of two
+WATCH_RING_MASK = WATCH_RING_SIZE - 1
+
+
 class ClientOption:
     """Class to hold client configuration options."""
     def __init__(self, option_func):
@@ -29,6 +40,70 @@ def WithID(client_id: str) -> ClientOption:
     return ClientOption(option_func)
 
 
+def WithThreadSafe(thread_safe: bool) -> ClientOption:
+    """
+    Choose whether the client may be shared between threads.
+    
+    A client that is not thread safe drops the per-command lock and the
+    background reader thread, and reads each response on the calling thread.
+    """
+    def option_func(client):
+        client.thread_safe = thread_safe
+    return ClientOption(option_func)
+
+
+def WithUnixSocket(path: Optional[str] = UNIX_SOCKET_PATH) -> ClientOption:
+    """
+    Connect over a Unix socket when the server is on the local host.
+    
+    This is off by default, because a socket path says nothing about which
+    port's server owns it. Only enable it when the socket belongs to the
+    server at host and port. Pass None to connect over TCP.
+    """
+    def option_func(client):
+        client.unix_socket_path = path
+    return ClientOption(option_func)
+
+
+class _PendingResponse:
+    """Slot for a response that has been requested but not read yet."""
+    __slots__ = ("event", "response")
+
+    def __init__(self, response: Optional[Response] = None):
+        self.event = threading.Event()
+        self.response = response
+
+    def set(self, response: Response) -> None:
+        """Fill the slot and wake the waiting caller."""
+        self.response = response
+        self.event.set()
+
+    def fail(self, error: str) -> None:
+        """Fill the slot with an error response."""
+        self.set(dice_io._error(self.response, error))
+
+    def wait(self, timeout: Optional[float]) -> Response:
+        """Wait for the slot to be filled and return its response."""
+        if not self.event.wait(timeout):
+            return Response(err="timed out")
+        return self.response
+
+
+class _WatchStop(threading.Event):
+    """Event returned by open_watch_channel(); setting it also shuts the watch connection down."""
+
+    def __init__(self, on_set: Callable[[], None]):
+        super().__init__()
+        self._on_set = on_set
+
+    def set(self) -> None:
+        """Stop watching and wake the watch thread."""
+        if self.is_set():
+            return
+        super().set()
+        self._on_set()
+
+
 class Client:
     """DiceDB client."""
     
@@ -46,50 +121,332 @@ class Client:
         self.id = str(uuid.uuid4())
         self.conn = None
         self.watch_conn = None
+        self._reader = None
+        self._watch_reader = None
         self.watch_ch = None
-        self._lock = threading.RLock()
+        self.thread_safe = True
+        self.unix_socket_path = None
+        self._lock = threading.Lock()
+        self._wbuf = bytearray()
+        self._pending = None
+        self._broken = False
+        self._orphans = 0
+        self._closed = False
         self._watch_thread = None
+        self._watch_ring = None
         
-        # Apply options
+        # Apply options, keeping them so the client can be rebuilt
+        self._options = options
         for option in options:
             option.apply(self)
         
+        self._send_lock = threading.Lock() if self.thread_safe else contextlib.nullcontext()
+        
         # Connect to the server
         self._connect()
         
         # Perform handshake
-        resp = self.fire(Command(cmd="HANDSHAKE", args=[self.id, "command"]))
+        resp = self._handshake(self._reader, "command")
         if resp.err:
             raise ConnectionError(f"Could not complete the handshake: {resp.err}")
+        
+        if self.thread_safe:
+            self._start_reader()
     
     def _connect(self) -> None:
         """Establish a connection to the DiceDB server."""
         try:
-            self.conn = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.conn.settimeout(5)  # 5 second timeout
-            self.conn.connect((self.host, self.port))
+            self.conn = self._open_socket()
+            self._reader = dice_io.FrameReader(self.conn)
         except socket.error as e:
             raise ConnectionError(f"Failed to connect to {self.host}:{self.port}: {str(e)}")
     
-    def _fire(self, cmd: Command, conn: socket.socket) -> Response:
-        """Send a command to the server and return the response."""
-        if not dice_io.write(conn, cmd):
+    def _open_socket(self) -> socket.socket:
+        """
+        Open a socket to the server, tuned for small request/response traffic.
+        
+        If WithUnixSocket() was given and the server is on the local host,
+        its Unix socket is used instead of TCP to skip the loopback TCP/IP
+        stack.
+        """
+        if self.host in LOCAL_HOSTS and self.unix_socket_path and hasattr(socket, "AF_UNIX") \
+                and os.path.exists(self.unix_socket_path):
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            conn.settimeout(CONNECT_TIMEOUT)
+            try:
+                conn.connect(self.unix_socket_path)
+                return conn
+            except socket.error:
+                # Stale socket file or no permission; fall back to TCP
+                conn.close()
+        
+        conn = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        conn.settimeout(CONNECT_TIMEOUT)
+        # Buffer sizes must be set before connecting to affect the TCP window
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+        conn.connect((self.host, self.port))
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return conn
+    
+    def _start_reader(self) -> None:
+        """Start the background thread that reads responses for the current connection."""
+        pending = deque()
+        thread = threading.Thread(target=self._read_responses, args=(self._reader, pending), daemon=True)
+        with self._send_lock:
+            self._pending = pending
+        thread.start()
+    
+    def _read_responses(self, reader: dice_io.FrameReader, pending: deque) -> None:
+        """
+        Background thread that hands framed responses to waiting callers.
+        
+        The server answers commands in order, so each response belongs to the
+        oldest pending slot. When the connection fails, the remaining slots
+        are failed with the connection error.
+        """
+        while True:
+            try:
+                payload = reader.read_frame()
+            except (socket.error, ValueError) as e:
+                error = str(e)
+                break
+            
+            if pending:
+                slot = pending.popleft()
+                slot.set(dice_io.deserialize(payload, slot.response))
+        
+        with self._send_lock:
+            if self._pending is pending:
+                self._pending = None
+        
+        while pending:
+            pending.popleft().fail(error)
+        
+        reader.release()
+    
+    def _fire(self, cmd: Command, reader: dice_io.FrameReader) -> Response:
+        """Send a command on a connection not owned by a reader thread and return the response."""
+        if not dice_io.write(reader.conn, cmd):
             return Response(err="Failed to write command to socket")
         
-        return dice_io.read(conn)
+        return reader.read()
     
-    def fire(self, cmd: Command) -> Response:
-        """Send a command to the server and return the response."""
-        with self._lock:
-            result = self._fire(cmd, self.conn)
-            if result.err:
-                if self.check_and_reconnect(result.err):
-                    return self.fire(cmd)
-            return result
+    def _handshake(self, reader: dice_io.FrameReader, mode: str) -> Response:
+        """
+        Perform the handshake on a new connection.
+        
+        Once it succeeds the socket is switched to blocking mode; later
+        operations only time out when the caller asks for a timeout.
+        """
+        resp = self._fire(Command(cmd="HANDSHAKE", args=[self.id, mode]), reader)
+        if not resp.err:
+            reader.conn.settimeout(None)
+        return resp
+    
+    def _read_inline(self, reader: dice_io.FrameReader, responses: Sequence[Optional[Response]],
+                     timeout: Optional[float]) -> List[Response]:
+        """
+        Read one response per entry of responses on the calling thread.
+        
+        Replies to earlier calls that timed out are skipped first. If this
+        call times out, the replies it leaves unread are counted so the next
+        call can skip them and the stream stays aligned.
+        """
+        conn = reader.conn
+        deadline = None if timeout is None else time.monotonic() + timeout
+        results = []
+        try:
+            while self._orphans or len(results) < len(responses):
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise socket.timeout("timed out")
+                    conn.settimeout(remaining)
+                
+                payload = reader.read_frame()
+                if self._orphans:
+                    self._orphans -= 1
+                    continue
+                results.append(dice_io.deserialize(payload, responses[len(results)]))
+        except socket.timeout as e:
+            self._orphans += len(responses) - len(results)
+            results.extend(dice_io._error(response, str(e)) for response in responses[len(results):])
+        except (socket.error, ValueError) as e:
+            # The connection is broken; later calls will reconnect.
+            self._broken = True
+            results.extend(dice_io._error(response, str(e)) for response in responses[len(results):])
+        finally:
+            if deadline is not None:
+                conn.settimeout(None)
+        
+        return results
+    
+    def _send(self, cmds: Sequence[Command], slots: Sequence[_PendingResponse]) -> dice_io.FrameReader:
+        """Queue a slot for each command and write the commands in a single call."""
+        with self._send_lock:
+            reader = self._reader
+            pending = self._pending
+            if pending is None:
+                error = "Client is closed" if self._closed else "EOF: connection closed by server"
+                for slot in slots:
+                    slot.fail(error)
+                return reader
+            
+            for cmd in cmds:
+                dice_io.append(self._wbuf, cmd)
+            pending.extend(slots)
+            
+            if not dice_io.flush(reader.conn, self._wbuf):
+                # The connection is broken; later callers will reconnect.
+                self._pending = None
+                for slot in slots:
+                    # The reader thread may have answered part of the batch
+                    # before the write failed; those slots are already filled.
+                    try:
+                        pending.remove(slot)
+                    except ValueError:
+                        continue
+                    slot.fail("Failed to write command to socket")
+        
+        return reader
+    
+    def _roundtrip(self, cmds: List[Command], responses: List[Optional[Response]],
+                   timeout: Optional[float]) -> Tuple[dice_io.FrameReader, List[Response]]:
+        """
+        Write the commands and collect one response per command.
+        
+        Each entry of responses is either None or an existing Response to
+        fill in place. The timeout covers the whole batch. Returns the
+        reader of the connection that was used.
+        """
+        if self.thread_safe:
+            slots = [_PendingResponse(response) for response in responses]
+            reader = self._send(cmds, slots)
+            if timeout is None:
+                return reader, [slot.wait(None) for slot in slots]
+            
+            deadline = time.monotonic() + timeout
+            return reader, [slot.wait(max(deadline - time.monotonic(), 0)) for slot in slots]
+        
+        # Single-threaded: nothing else reads the connection, so read inline.
+        reader = self._reader
+        if self._closed or self._broken:
+            error = "Client is closed" if self._closed else "EOF: connection closed by server"
+            return reader, [dice_io._error(response, error) for response in responses]
+        
+        for cmd in cmds:
+            dice_io.append(self._wbuf, cmd)
+        if not dice_io.flush(reader.conn, self._wbuf):
+            self._broken = True
+            return reader, [dice_io._error(response, "Failed to write command to socket") for response in responses]
+        
+        return reader, self._read_inline(reader, responses, timeout)
+    
+    def _roundtrip_one(self, cmd: Command, response: Optional[Response],
+                       timeout: Optional[float]) -> Tuple[dice_io.FrameReader, Response]:
+        """
+        Single-command form of _roundtrip.
+        
+        fire() and fire_into() go through here so the per-command path does
+        not build the slot, response and result lists that batches need.
+        """
+        if self.thread_safe:
+            slot = _PendingResponse(response)
+            reader = self._send((cmd,), (slot,))
+            return reader, slot.wait(timeout)
+        
+        reader = self._reader
+        if self._closed or self._broken:
+            error = "Client is closed" if self._closed else "EOF: connection closed by server"
+            return reader, dice_io._error(response, error)
+        
+        dice_io.append(self._wbuf, cmd)
+        if not dice_io.flush(reader.conn, self._wbuf):
+            self._broken = True
+            return reader, dice_io._error(response, "Failed to write command to socket")
+        
+        if timeout is None and not self._orphans:
+            try:
+                payload = reader.read_frame()
+            except (socket.error, ValueError) as e:
+                self._broken = True
+                return reader, dice_io._error(response, str(e))
+            return reader, dice_io.deserialize(payload, response)
+        return reader, self._read_inline(reader, (response,), timeout)[0]
+    
+    def fire(self, cmd: Command, timeout: Optional[float] = None) -> Response:
+        """
+        Send a command to the server and return the response.
+        
+        Args:
+            cmd: The command to send
+            timeout: Seconds to wait for the reply, or None to wait indefinitely
+        """
+        reader, result = self._roundtrip_one(cmd, None, timeout)
+        if result.err:
+            if self._check_and_reconnect(result.err, reader):
+                return self.fire(cmd, timeout)
+        return result
+    
+    def fire_into(self, cmd: Command, response: Response, timeout: Optional[float] = None) -> Response:
+        """
+        Send a command to the server and read the reply into an existing Response.
+        
+        The response is reset and filled in place, so a caller issuing many
+        commands can reuse one object instead of allocating one per reply.
+        On a thread-safe client a reply that arrives after a timeout may still
+        be written into the object, so it should not be reused after one.
+        
+        Args:
+            cmd: The command to send
+            response: The Response to fill
+            timeout: Seconds to wait for the reply, or None to wait indefinitely
+        
+        Returns:
+            The passed-in response, or a new Response if a thread-safe call timed out
+        """
+        reader, result = self._roundtrip_one(cmd, response, timeout)
+        if result.err:
+            if self._check_and_reconnect(result.err, reader):
+                return self.fire_into(cmd, response, timeout)
+        return result
+    
+    def fire_pipeline(self, cmds: List[Command], timeout: Optional[float] = None) -> List[Response]:
+        """
+        Send several commands in a single write and return their responses.
+        
+        Responses are returned in command order. Every response is read even
+        if an earlier one carries an error, so the connection stays aligned
+        for later commands. Commands are not replayed after a reconnect.
+        
+        Args:
+            cmds: The commands to send
+            timeout: Seconds to wait for all replies, or None to wait indefinitely
+        """
+        if not cmds:
+            return []
+        
+        reader, results = self._roundtrip(cmds, [None] * len(cmds), timeout)
+        for result in results:
+            if result.err and self._check_and_reconnect(result.err, reader):
+                break
+        return results
     
     def fire_string(self, cmd_str: str) -> Response:
         """Send a command string to the server and return the response."""
         cmd_str = cmd_str.strip()
+        
+        # Fast path for commands with at most one argument. A printable string
+        # contains no whitespace other than plain spaces, so partitioning on
+        # " " gives the same tokens as split() without building a list.
+        if cmd_str and cmd_str.isprintable():
+            cmd, _, rest = cmd_str.partition(" ")
+            if not rest:
+                return self.fire(Command(cmd=cmd, args=[]))
+            if " " not in rest:
+                return self.fire(Command(cmd=cmd, args=[rest]))
+        
         tokens = cmd_str.split()
         
         cmd = tokens[0]
@@ -97,53 +454,112 @@ class Client:
         
         return self.fire(Command(cmd=cmd, args=args))
     
+    def mget(self, keys: List[str]) -> Response:
+        """
+        Get several keys with a single MGET command.
+        
+        On success, v_list holds the values in key order and v_ss_map maps
+        each key to its value.
+        """
+        keys = list(keys)
+        resp = self.fire(Command(cmd="MGET", args=keys))
+        if not resp.err and resp.v_list is not None:
+            resp.v_ss_map = dict(zip(keys, resp.v_list))
+        return resp
+    
+    def mset(self, mapping: Dict[str, str]) -> Response:
+        """Set several keys with a single MSET command."""
+        args = []
+        for key, value in mapping.items():
+            args.append(key)
+            args.append(value)
+        return self.fire(Command(cmd="MSET", args=args))
+    
     def check_and_reconnect(self, error: str) -> bool:
-        """Check if the error is due to a broken connection and try to reconnect."""
-        if "EOF" in error or "Broken pipe" in error:
+        """Reconnect if the current connection has failed, and report whether it was replaced."""
+        return self._check_and_reconnect(error, self._reader)
+    
+    def _check_and_reconnect(self, error: str, reader: dice_io.FrameReader) -> bool:
+        """
+        Reconnect if the connection served by reader has failed.
+        
+        Returns True when the caller should retry on a new connection. An
+        error on a connection that is still attached came from the server,
+        whatever its text, so nothing is replaced and False is returned.
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            
+            # Another caller has already replaced the broken connection.
+            if self._reader is not reader:
+                return True
+            
+            if not self._detached():
+                return False
+            
             print(f"Error in connection: {error}. Reconnecting...")
             
             try:
-                with self._lock:
-                    if self.conn:
-                        self.conn.close()
-                    
-                    self._connect()
-                    
-                    # Re-authenticate
-                    resp = self._fire(Command(cmd="HANDSHAKE", args=[self.id, "command"]), self.conn)
-                    if resp.err:
-                        print(f"Failed to reconnect: {resp.err}")
-                        return False
-                    
-                    return True
+                with self._send_lock:
+                    self._pending = None
+                self._broken = True
+                
+                if self.conn:
+                    _close_socket(self.conn)
+                    if not self.thread_safe:
+                        self._reader.release()
+                
+                self._connect()
+                self._orphans = 0
+                
+                # Re-authenticate
+                resp = self._handshake(self._reader, "command")
+                if resp.err:
+                    print(f"Failed to reconnect: {resp.err}")
+                    return False
+                
+                self._broken = False
+                if self.thread_safe:
+                    self._start_reader()
+                return True
             except Exception as e:
                 print(f"Failed to reconnect: {str(e)}")
                 return False
-        
-        return False
     
-    def watch_ch(self) -> Tuple[Optional[threading.Event], Response]:
+    def open_watch_channel(self) -> threading.Event:
         """
-        Create a channel to watch for server events.
+        Open a channel to watch for server events.
+        
+        Events are received with watch_next(). Opening an already open
+        channel returns the existing one; a stopped channel is replaced.
         
         Returns:
-            A tuple containing a threading.Event to stop watching and a Response channel
+            A threading.Event that stops watching when set
         """
         with self._lock:
             if self.watch_ch is not None:
-                return self.watch_ch
+                if not self.watch_ch.is_set():
+                    return self.watch_ch
+                
+                # Stopped; the old watch thread is already exiting
+                self._watch_thread.join()
+                self.watch_ch = None
+                self.watch_conn = None
             
-            self.watch_ch = threading.Event()
-            self.watch_queue = []
-            self.watch_condition = threading.Condition()
+            self.watch_ch = _WatchStop(self._stop_watch)
+            self._watch_ring = [None] * WATCH_RING_SIZE
+            self._watch_head = 0
+            self._watch_tail = 0
+            self._watch_ready = threading.Semaphore(0)
+            self._watch_free = threading.Semaphore(WATCH_RING_SIZE)
             
             try:
-                self.watch_conn = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                self.watch_conn.settimeout(5)
-                self.watch_conn.connect((self.host, self.port))
+                self.watch_conn = self._open_socket()
+                self._watch_reader = dice_io.FrameReader(self.watch_conn)
                 
                 # Handshake for watch connection
-                resp = self._fire(Command(cmd="HANDSHAKE", args=[self.id, "watch"]), self.watch_conn)
+                resp = self._handshake(self._watch_reader, "watch")
                 if resp.err:
                     raise ConnectionError(f"Could not complete the watch handshake: {resp.err}")
                 
@@ -151,43 +567,130 @@ class Client:
                 self._watch_thread = threading.Thread(target=self._watch, daemon=True)
                 self._watch_thread.start()
                 
-                return self.watch_ch, self.watch_queue
+                return self.watch_ch
             
             except Exception as e:
                 self.watch_ch = None
+                if self.watch_conn:
+                    _close_socket(self.watch_conn)
                 raise ConnectionError(f"Failed to setup watch connection: {str(e)}")
     
+    def watch_next(self, timeout: Optional[float] = None) -> Optional[Response]:
+        """
+        Return the next event from the watch channel.
+        
+        Events are buffered in a ring of WATCH_RING_SIZE entries; once it is
+        full, the watch thread stops reading until events are consumed. This
+        must only be called from one consumer thread at a time.
+        
+        Args:
+            timeout: Seconds to wait for an event, or None to wait indefinitely
+        
+        Returns:
+            The next event, or None if no event arrived within the timeout
+            or the channel has been stopped
+        """
+        if self._watch_ring is None:
+            raise ConnectionError("Watch channel is not open")
+        
+        stop = self.watch_ch
+        ready = self._watch_ready
+        if not ready.acquire(timeout=timeout):
+            return None
+        if stop.is_set():
+            # Pass the wakeup from _stop_watch() on to any later call
+            ready.release()
+            return None
+        
+        index = self._watch_head & WATCH_RING_MASK
+        resp = self._watch_ring[index]
+        self._watch_ring[index] = None
+        self._watch_head += 1
+        self._watch_free.release()
+        return resp
+    
+    def _watch_push(self, resp: Response) -> None:
+        """Add an event to the watch ring, waiting while the ring is full."""
+        self._watch_free.acquire()
+        self._watch_ring[self._watch_tail & WATCH_RING_MASK] = resp
+        self._watch_tail += 1
+        self._watch_ready.release()
+    
     def _watch(self) -> None:
         """Background thread that watches for server events."""
         while not self.watch_ch.is_set():
             try:
-                resp = dice_io.read(self.watch_conn)
-                
-                with self.watch_condition:
-                    self.watch_queue.append(resp)
-                    self.watch_condition.notify_all()
-                
+                payload = self._watch_reader.read_frame()
             except Exception as e:
-                if not self.check_and_reconnect(str(e)):
-                    with self.watch_condition:
-                        error_resp = Response(err=f"Watch error: {str(e)}")
-                        self.watch_queue.append(error_resp)
-                        self.watch_condition.notify_all()
-                    
-                    # Break out of the loop if we can't reconnect
-                    break
+                if not self.watch_ch.is_set():
+                    self._watch_push(Response(err=f"Watch error: {str(e)}"))
+                
+                # The watch connection is gone; stop reading it
+                break
+            
+            self._watch_push(dice_io.deserialize(payload))
+        
+        self._watch_reader.release()
+    
+    def _stop_watch(self) -> None:
+        """Wake the watch thread and any watch_next() caller once watch_ch is set."""
+        # The thread may be waiting for ring space or blocked reading the connection
+        self._watch_free.release()
+        _close_socket(self.watch_conn)
+        self._watch_ready.release()
+    
+    def _detached(self) -> bool:
+        """
+        Check whether the current connection has failed and awaits a reconnect.
+        
+        A thread-safe client detaches the pending queue of a failed
+        connection; a single-threaded one marks the connection as broken.
+        """
+        if self.thread_safe:
+            return self._pending is None
+        return self._broken
+    
+    def is_connected(self) -> bool:
+        """
+        Check whether the command connection is still usable.
+        
+        This is a local check only; no command is sent to the server.
+        """
+        if self._closed or self.conn is None:
+            return False
+        
+        if self._detached():
+            return False
+        
+        try:
+            self.conn.getpeername()
+        except socket.error:
+            return False
+        return True
     
     def close(self) -> None:
         """Close the client connection."""
         with self._lock:
+            self._closed = True
+            with self._send_lock:
+                self._pending = None
+            
             if self.watch_ch:
                 self.watch_ch.set()
             
             if self.conn:
-                self.conn.close()
-            
-            if self.watch_conn:
-                self.watch_conn.close()
+                _close_socket(self.conn)
+                if not self.thread_safe:
+                    self._reader.release()
+
+
+def _close_socket(conn: socket.socket) -> None:
+    """Shut down and close a socket, waking any thread blocked reading it."""
+    try:
+        conn.shutdown(socket.SHUT_RDWR)
+    except socket.error:
+        pass
+    conn.close()
 
 
 def get_or_create_client(client: Optional[Client] = None, host: str = "localhost", port: int = 7379) -> Client:
@@ -205,12 +708,16 @@ def get_or_create_client(client: Optional[Client] = None, host: str = "localhost
     if client is None:
         return Client(host, port)
     
+    # Reuse the client as-is while its connection is still up
+    if client.is_connected():
+        return client
+    
     # If the client is provided but not connected, create a new one with the same settings
     try:
-        new_client = Client(client.host, client.port)
+        new_client = Client(client.host, client.port, *client._options)
         
-        if client.conn:
-            client.conn.close()
+        # Retire the old client, including any watch channel it still holds
+        client.close()
         
         return new_client
     except Exception as e:
@@ -1,65 +1,255 @@
 """
 I/O operations for DiceDB client-server communication.
+
+Every message on the wire is framed as a 4-byte big-endian length prefix
+followed by a payload of exactly that many bytes. The payload starts with
+a one-byte wire version, followed by the message fields as a msgpack array
+in declaration order.
 """
 import socket
 import struct
-import pickle
-from typing import Tuple
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple, Union
+
+import msgpack
 
 from .wire import Command, Response, ValueType
 
 
 # Constants
 MAX_REQUEST_SIZE = 32 * 1024 * 1024  # 32 MB
-IO_BUFFER_SIZE = 16 * 1024  # 16 KB
+IO_BUFFER_SIZE = 64 * 1024  # 64 KB
 IDLE_TIMEOUT = 30 * 60  # 30 minutes
 
+HEADER = struct.Struct(">I")
+MSG_WAITALL = getattr(socket, "MSG_WAITALL", 0)
+TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)
+WIRE_VERSION = 1
+_VERSION_TAG = bytes((WIRE_VERSION,))
+
+# Receive buffers of IO_BUFFER_SIZE handed back by finished readers, so new
+# connections do not have to allocate their own.
+_buf_pool: Deque[bytearray] = deque(maxlen=64)
+
+# Framed bytes of argument-less commands such as PING, whose payload never
+# changes, keyed by command name. Bounded so arbitrary names cannot grow it.
+FRAME_CACHE_SIZE = 256
+_frame_cache: Dict[str, bytes] = {}
+
+
+def _acquire_buffer() -> bytearray:
+    """Take a receive buffer from the pool, allocating one if it is empty."""
+    try:
+        return _buf_pool.pop()
+    except IndexError:
+        return bytearray(IO_BUFFER_SIZE)
+
+
+def _release_buffer(buf: bytearray) -> None:
+    """Return a receive buffer to the pool."""
+    if len(buf) == IO_BUFFER_SIZE:
+        _buf_pool.append(buf)
+
 
 def serialize(cmd: Command) -> bytes:
     """Serialize a Command object to bytes."""
-    return pickle.dumps(cmd)
+    return _VERSION_TAG + msgpack.packb((cmd.cmd, cmd.args))
+
 
+def _error(resp: Optional[Response], error: str) -> Response:
+    """Return an error Response, reusing resp if one was given."""
+    if resp is None:
+        return Response(err=error)
+    resp.clear()
+    resp.err = error
+    return resp
 
-def deserialize(data: bytes) -> Response:
-    """Deserialize bytes to a Response object."""
+
+def deserialize(data: Union[bytes, bytearray, memoryview], resp: Optional[Response] = None) -> Response:
+    """
+    Deserialize bytes to a Response object.
+
+    Any bytes-like object is accepted and parsed in place, so a receive
+    buffer or a view into one never has to be copied into bytes first. If
+    resp is given, it is reset and filled in place instead of allocating a
+    new Response.
+    """
     try:
-        return pickle.loads(data)
+        view = memoryview(data)
+        if not view or view[0] != WIRE_VERSION:
+            version = view[0] if view else None
+            return _error(resp, f"Unsupported wire version: {version}")
+
+        fields = msgpack.unpackb(view[1:], raw=False)
+        if resp is None:
+            resp = Response(*fields)
+        else:
+            Response.__init__(resp, *fields)
+        return resp
     except Exception as e:
-        return Response(err=f"Failed to deserialize response: {str(e)}")
+        return _error(resp, f"Failed to deserialize response: {str(e)}")
+
+
+class FrameReader:
+    """
+    Buffered reader for framed Responses on a single connection.
+
+    Reads ahead into a per-connection receive buffer, so a small response
+    costs one recv_into call for both its header and body, and responses
+    that arrive back to back are parsed without any further syscalls.
+    """
+
+    def __init__(self, conn: socket.socket, size: int = IO_BUFFER_SIZE):
+        self.conn = conn
+        self._buf = _acquire_buffer() if size == IO_BUFFER_SIZE else bytearray(size)
+        self._view = memoryview(self._buf)
+        self._start = 0
+        self._end = 0
+        # Re-armed after every read that had to go to the kernel
+        self._quickack = quickack(conn)
+
+    def _fill(self, need: int) -> None:
+        """Ensure at least need bytes are buffered past the read position."""
+        pending = self._end - self._start
+        if pending >= need:
+            return
+
+        if self._start + need > len(self._buf):
+            # Move the partial frame to the front, growing the buffer if the
+            # frame does not fit in it at all.
+            if need > len(self._buf):
+                buf = bytearray(need)
+                buf[:pending] = self._view[self._start:self._end]
+                self._buf = buf
+                self._view = memoryview(buf)
+            else:
+                partial = self._view[self._start:self._end]
+                if self._start < pending:
+                    # Source and destination overlap; copy out first
+                    partial = partial.tobytes()
+                self._buf[:pending] = partial
+            self._start = 0
+            self._end = pending
+
+        # The first read takes whatever has arrived, which may already hold
+        # this frame and more. If it is still short, wait for exactly the
+        # rest of the frame with MSG_WAITALL in a single call.
+        count = self.conn.recv_into(self._view[self._end:])
+        if not count:
+            raise ConnectionError("EOF: connection closed by server")
+        self._end += count
 
+        # A socket with a timeout is non-blocking underneath, where
+        # MSG_WAITALL is unsupported on some platforms (Windows)
+        flags = MSG_WAITALL if self.conn.gettimeout() is None else 0
+        while self._end - self._start < need:
+            short = self._start + need - self._end
+            count = self.conn.recv_into(self._view[self._end:self._end + short], short, flags)
+            if not count:
+                raise ConnectionError("EOF: connection closed by server")
+            self._end += count
 
-def read(conn: socket.socket) -> Response:
-    """Read a Response from a socket connection."""
-    result = bytearray()
-    
-    while True:
+        if self._quickack:
+            quickack(self.conn)
+
+    def read_frame(self) -> memoryview:
+        """
+        Read the next framed payload.
+
+        The returned view points into the receive buffer and is only valid
+        until the next call.
+        """
+        # Only drop into _fill() when the buffer runs short; in steady state
+        # the whole frame is usually here already.
+        if self._end - self._start < HEADER.size:
+            self._fill(HEADER.size)
+        (size,) = HEADER.unpack_from(self._buf, self._start)
+        if size > MAX_REQUEST_SIZE:
+            raise ValueError("Request too large")
+
+        if self._end - self._start < HEADER.size + size:
+            self._fill(HEADER.size + size)
+        begin = self._start + HEADER.size
+        self._start = begin + size
+        if self._start == self._end:
+            self._start = self._end = 0
+        return self._view[begin:begin + size]
+
+    def release(self) -> None:
+        """Hand the receive buffer back to the pool once the reader is done with it."""
+        _release_buffer(self._buf)
+        self._buf = bytearray()
+        self._view = memoryview(self._buf)
+        self._start = self._end = 0
+
+    def read(self, resp: Optional[Response] = None) -> Response:
+        """
+        Read the next Response from the connection.
+
+        If resp is given, it is filled in place instead of allocating a new
+        Response.
+        """
         try:
-            chunk = conn.recv(IO_BUFFER_SIZE)
-            if not chunk:
-                break
-                
-            if len(result) + len(chunk) > MAX_REQUEST_SIZE:
-                return Response(err="Request too large")
-                
-            result.extend(chunk)
-            
-            if len(chunk) < IO_BUFFER_SIZE:
-                break
-                
-        except socket.error as e:
-            return Response(err=str(e))
-    
-    if not result:
-        return Response(err="Empty response or connection closed")
-    
-    return deserialize(bytes(result))
+            payload = self.read_frame()
+        except (socket.error, ValueError) as e:
+            return _error(resp, str(e))
+
+        return deserialize(payload, resp)
+
+
+def frame(cmd: Command) -> bytes:
+    """Serialize a Command and prefix it with its length."""
+    if not cmd.args:
+        framed = _frame_cache.get(cmd.cmd)
+        if framed is not None:
+            return framed
+
+    data = serialize(cmd)
+    framed = HEADER.pack(len(data)) + data
+    if not cmd.args and len(_frame_cache) < FRAME_CACHE_SIZE:
+        _frame_cache[cmd.cmd] = framed
+    return framed
+
+
+def append(buf: bytearray, cmd: Command) -> None:
+    """Append a framed Command to a write buffer."""
+    if not cmd.args:
+        buf += frame(cmd)
+        return
+
+    data = serialize(cmd)
+    buf += HEADER.pack(len(data))
+    buf += data
+
+
+def quickack(conn: socket.socket) -> bool:
+    """
+    Ask the kernel to acknowledge received data immediately.
+
+    Linux clears TCP_QUICKACK again as it processes traffic, so it has to be
+    re-armed after reads. Returns False if the socket does not support it.
+    """
+    if TCP_QUICKACK is None or conn.family not in (socket.AF_INET, socket.AF_INET6):
+        return False
+    conn.setsockopt(socket.IPPROTO_TCP, TCP_QUICKACK, 1)
+    return True
+
+
+def flush(conn: socket.socket, buf: bytearray) -> bool:
+    """Send the contents of a write buffer in a single call and clear it."""
+    try:
+        conn.sendall(buf)
+        return True
+    except Exception as e:
+        return False
+    finally:
+        buf.clear()
 
 
 def write(conn: socket.socket, cmd: Command) -> bool:
     """Write a Command to a socket connection."""
     try:
-        data = serialize(cmd)
-        conn.sendall(data)
+        conn.sendall(frame(cmd))
         return True
     except Exception as e:
         return False
\ No newline at end of file
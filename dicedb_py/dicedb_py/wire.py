@@ -6,7 +6,7 @@ from typing import List, Dict, Optional, Union, Any
 from enum import Enum
 
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     """Command message sent to the DiceDB server."""
     cmd: str
@@ -26,37 +26,56 @@ class ValueType(Enum):
     BYTES = 'bytes'
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
-    """Response message received from the DiceDB server."""
+    """
+    Response message received from the DiceDB server.
+
+    The typed accessors (v_nil, v_int, v_str, v_float, v_bytes) are plain
+    fields filled from value_type and value when the Response is built, so
+    reading them is a simple attribute lookup.
+    """
     err: str = ""
     value_type: ValueType = None
     value: Any = None
     attrs: Dict[str, Any] = None
     v_list: List[Any] = None
     v_ss_map: Dict[str, str] = None
+    v_nil: bool = False
+    v_int: int = 0
+    v_str: str = ""
+    v_float: float = 0.0
+    v_bytes: bytes = b""
+
+    def __post_init__(self):
+        value_type = self.value_type
+        if value_type is None:
+            return
+
+        if not isinstance(value_type, ValueType):
+            value_type = self.value_type = ValueType(value_type)
+
+        if value_type is ValueType.STR:
+            self.v_str = self.value
+        elif value_type is ValueType.INT:
+            self.v_int = self.value
+        elif value_type is ValueType.NIL:
+            self.v_nil = True
+        elif value_type is ValueType.FLOAT:
+            self.v_float = self.value
+        elif value_type is ValueType.BYTES:
+            self.v_bytes = self.value
 
-    @property
-    def v_nil(self) -> bool:
-        """Get nil value."""
-        return self.value_type == ValueType.NIL
-
-    @property
-    def v_int(self) -> int:
-        """Get integer value."""
-        return self.value if self.value_type == ValueType.INT else 0
-
-    @property
-    def v_str(self) -> str:
-        """Get string value."""
-        return self.value if self.value_type == ValueType.STR else ""
-
-    @property
-    def v_float(self) -> float:
-        """Get float value."""
-        return self.value if self.value_type == ValueType.FLOAT else 0.0
-
-    @property
-    def v_bytes(self) -> bytes:
-        """Get bytes value."""
-        return self.value if self.value_type == ValueType.BYTES else b""
\ No newline at end of file
+    def clear(self) -> None:
+        """Reset all fields so the Response can be reused."""
+        self.err = ""
+        self.value_type = None
+        self.value = None
+        self.attrs = None
+        self.v_list = None
+        self.v_ss_map = None
+        self.v_nil = False
+        self.v_int = 0
+        self.v_str = ""
+        self.v_float = 0.0
+        self.v_bytes = b""
\ No newline at end of file
@@ -16,10 +16,13 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/dicedb/dicedb-py",
     packages=find_packages(),
+    install_requires=[
+        "msgpack>=1.0",
+    ],
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: BSD License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.10",
 )
\ No newline at end of file
@@ -0,0 +1,337 @@
+"""
+Tests for the DiceDB client against an in-process fake server.
+
+Run from the dicedb_py directory with: python -m unittest discover tests
+"""
+import contextlib
+import io
+import socket
+import socketserver
+import struct
+import threading
+import time
+import unittest
+
+import msgpack
+
+from dicedb_py import Client, WithID, WithThreadSafe
+from dicedb_py.client import get_or_create_client
+from dicedb_py import io as dice_io
+from dicedb_py.wire import Command, Response, ValueType
+
+
+_VALUE_PARSERS = {
+    "nil": lambda value: None,
+    "int": int,
+    "str": str,
+    "float": float,
+    "bytes": str.encode,
+}
+
+
+class _FakeHandler(socketserver.StreamRequestHandler):
+    """
+    Speaks the client's wire format and answers each command in order.
+
+    HANDSHAKE replies OK unless the server refuses handshakes, and SLEEP
+    <seconds> replies OK after sleeping. The first CLOSE or RESET sent to a
+    server drops the connection without replying, RESET with a TCP reset.
+    BADVERSION replies with an unknown wire version, ERR <message> replies
+    with that error and VALUE <type> <value> replies with a value of that
+    type. MSET and MGET set and get keys in a store shared by the server's
+    connections. Anything else is echoed back as a string, in two writes for
+    SPLIT. Every command is logged on the server.
+    """
+
+    def reply(self, *fields, version=dice_io.WIRE_VERSION, split=False):
+        """Send a framed Response built from the given leading fields, optionally in two writes."""
+        fields = list(fields) + [None] * (6 - len(fields))
+        data = bytes((version,)) + msgpack.packb(fields)
+        framed = dice_io.HEADER.pack(len(data)) + data
+        if split:
+            self.wfile.write(framed[:len(framed) // 2])
+            time.sleep(0.05)
+            framed = framed[len(framed) // 2:]
+        self.wfile.write(framed)
+
+    def handle(self):
+        while True:
+            header = self.rfile.read(dice_io.HEADER.size)
+            if len(header) < dice_io.HEADER.size:
+                return
+            (size,) = dice_io.HEADER.unpack(header)
+            payload = self.rfile.read(size)
+            if len(payload) < size:
+                return
+            cmd, args = msgpack.unpackb(payload[1:], raw=False)
+            self.server.commands.append((cmd, args))
+
+            if cmd in ("CLOSE", "RESET") and not self.server.closed_once.is_set():
+                self.server.closed_once.set()
+                if cmd == "RESET":
+                    # Close before socketserver's shutdown() can send a FIN
+                    self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+                    self.rfile.close()
+                    self.wfile.close()
+                    self.connection.close()
+                return
+            if cmd == "BADVERSION":
+                self.reply("", "str", "OK", version=dice_io.WIRE_VERSION + 1)
+                continue
+            if cmd == "HANDSHAKE" and self.server.refuse_handshakes:
+                self.reply("handshake refused")
+                continue
+            if cmd == "MSET":
+                self.server.store.update(zip(args[::2], args[1::2]))
+                self.reply("", "str", "OK")
+                continue
+            if cmd == "MGET":
+                self.reply("", None, None, None, [self.server.store.get(key) for key in args])
+                continue
+            if cmd == "ERR":
+                self.reply(" ".join(args))
+                continue
+            if cmd == "VALUE":
+                value_type, value = args
+                self.reply("", value_type, _VALUE_PARSERS[value_type](value))
+                continue
+            if cmd == "SLEEP":
+                time.sleep(float(args[0]))
+            value = "OK" if cmd in ("HANDSHAKE", "SLEEP") else " ".join([cmd] + args)
+            self.reply("", "str", value, split=cmd == "SPLIT")
+
+
+class _FakeServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _FakeHandler)
+        self.closed_once = threading.Event()
+        self.commands = []
+        self.refuse_handshakes = False
+        self.store = {}
+
+
+class _ClientTests:
+    """Tests shared by thread-safe and single-threaded clients."""
+    thread_safe = True
+
+    def setUp(self):
+        self.server = _FakeServer()
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.client = Client("127.0.0.1", self.server.server_address[1], WithThreadSafe(self.thread_safe))
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def fire_quietly(self, cmd):
+        """Fire a command without the reconnect notice on stdout."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.client.fire(cmd)
+
+    def test_fire(self):
+        self.assertEqual(self.client.fire(Command("ECHO", ["a"])).v_str, "ECHO a")
+        self.assertEqual(self.client.fire_string("PING").v_str, "PING")
+
+    def test_fire_string_tokenizes_like_split(self):
+        for cmd_str in ("PING", "  PING  ", "GET k", "GET  k", "SET k v", "SET k  v ", "GET\tk", "SET k\nv"):
+            with self.subTest(cmd_str=cmd_str):
+                tokens = cmd_str.split()
+                resp = self.client.fire_string(cmd_str)
+                self.assertEqual(resp.v_str, " ".join(tokens))
+                self.assertEqual(self.server.commands[-1], (tokens[0], tokens[1:]))
+
+    def test_get_or_create_client_reuses_live_client(self):
+        self.assertIs(get_or_create_client(self.client), self.client)
+
+    def test_get_or_create_client_rebuilds_with_options(self):
+        port = self.server.server_address[1]
+        old = Client("127.0.0.1", port, WithID("fixed-id"), WithThreadSafe(self.thread_safe))
+        old.open_watch_channel()
+        # Drop the connection and refuse the reconnect, leaving old dead
+        self.server.refuse_handshakes = True
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(old.fire(Command("CLOSE")).err)
+        self.assertFalse(old.is_connected())
+        self.server.refuse_handshakes = False
+
+        new = get_or_create_client(old)
+        try:
+            self.assertIsNot(new, old)
+            self.assertEqual((new.id, new.thread_safe), ("fixed-id", self.thread_safe))
+            self.assertEqual(new.fire(Command("ECHO", ["a"])).v_str, "ECHO a")
+            self.assertEqual(old.fire(Command("PING")).err, "Client is closed")
+            old._watch_thread.join(2)
+            self.assertFalse(old._watch_thread.is_alive())
+        finally:
+            new.close()
+
+    def test_mset_and_mget(self):
+        self.assertEqual(self.client.mset({"a": "1", "b": "2"}).v_str, "OK")
+        self.assertEqual(self.server.commands[-1], ("MSET", ["a", "1", "b", "2"]))
+
+        resp = self.client.mget(["b", "missing", "a"])
+        self.assertEqual(resp.v_list, ["2", None, "1"])
+        self.assertEqual(resp.v_ss_map, {"b": "2", "missing": None, "a": "1"})
+
+    def test_typed_values(self):
+        resp = self.client.fire(Command("VALUE", ["int", "42"]))
+        self.assertEqual((resp.value_type, resp.v_int), (ValueType.INT, 42))
+        resp = self.client.fire(Command("VALUE", ["float", "1.5"]))
+        self.assertEqual((resp.value_type, resp.v_float), (ValueType.FLOAT, 1.5))
+        resp = self.client.fire(Command("VALUE", ["bytes", "raw"]))
+        self.assertEqual((resp.value_type, resp.v_bytes), (ValueType.BYTES, b"raw"))
+        resp = self.client.fire(Command("VALUE", ["nil", ""]))
+        self.assertEqual((resp.value_type, resp.v_nil), (ValueType.NIL, True))
+        resp = self.client.fire(Command("VALUE", ["str", "text"]))
+        self.assertEqual((resp.value_type, resp.v_str, resp.v_int), (ValueType.STR, "text", 0))
+
+    def test_fire_into_refills_response(self):
+        resp = Response()
+        self.assertIs(self.client.fire_into(Command("VALUE", ["int", "7"]), resp), resp)
+        self.assertEqual(resp.v_int, 7)
+
+        # Fields from the previous reply are cleared before refilling
+        self.assertIs(self.client.fire_into(Command("ECHO", ["a"]), resp), resp)
+        self.assertEqual((resp.value_type, resp.v_str, resp.v_int), (ValueType.STR, "ECHO a", 0))
+
+        self.assertIs(self.client.fire_into(Command("ERR", ["boom"]), resp), resp)
+        self.assertEqual((resp.err, resp.value_type, resp.v_str), ("boom", None, ""))
+
+    def test_frame_split_across_reads(self):
+        self.assertEqual(self.client.fire(Command("SPLIT", ["a" * 100])).v_str, "SPLIT " + "a" * 100)
+        # A timed call reads the rest of the frame on a socket with a timeout
+        self.assertEqual(self.client.fire(Command("SPLIT", ["b"]), timeout=2).v_str, "SPLIT b")
+
+    def test_unsupported_wire_version(self):
+        resp = self.client.fire(Command("BADVERSION"))
+        self.assertEqual(resp.err, f"Unsupported wire version: {dice_io.WIRE_VERSION + 1}")
+        # The frame was consumed, so the connection stays usable
+        self.assertEqual(self.client.fire(Command("ECHO", ["a"])).v_str, "ECHO a")
+
+    def test_server_error_is_not_retried(self):
+        # Error text that looks like a connection failure must not cause a
+        # reconnect or a resend while the connection is still up.
+        resp = self.client.fire(Command("ERR", ["unexpected", "EOF"]))
+        self.assertEqual(resp.err, "unexpected EOF")
+        self.assertEqual([cmd for cmd, _ in self.server.commands].count("ERR"), 1)
+        self.assertEqual([cmd for cmd, _ in self.server.commands].count("HANDSHAKE"), 1)
+        self.assertFalse(self.client.check_and_reconnect(resp.err))
+        self.assertEqual(self.client.fire(Command("ECHO", ["a"])).v_str, "ECHO a")
+
+    def test_fire_after_timeout_stays_aligned(self):
+        resp = self.client.fire(Command("SLEEP", ["0.3"]), timeout=0.05)
+        self.assertEqual(resp.err, "timed out")
+
+        self.assertEqual(self.client.fire(Command("ECHO", ["a"])).v_str, "ECHO a")
+        self.assertEqual(self.client.fire(Command("ECHO", ["b"]), timeout=2).v_str, "ECHO b")
+
+    def test_pipeline_after_timeout_stays_aligned(self):
+        cmds = [Command("SLEEP", ["0.3"]), Command("ECHO", ["a"]), Command("ECHO", ["b"])]
+        resps = self.client.fire_pipeline(cmds, timeout=0.05)
+        self.assertEqual([resp.err for resp in resps], ["timed out"] * 3)
+
+        resps = self.client.fire_pipeline([Command("ECHO", ["c"]), Command("ECHO", ["d"])], timeout=2)
+        self.assertEqual([resp.v_str for resp in resps], ["ECHO c", "ECHO d"])
+        self.assertEqual(self.client.fire(Command("ECHO", ["e"])).v_str, "ECHO e")
+
+    def test_reconnect_after_server_close(self):
+        # The command is replayed on the new connection, where it is echoed
+        self.assertEqual(self.fire_quietly(Command("CLOSE")).v_str, "CLOSE")
+        self.assertTrue(self.client.is_connected())
+        self.assertEqual(self.client.fire(Command("ECHO", ["a"])).v_str, "ECHO a")
+
+    def test_reconnect_after_server_reset_in_pipeline(self):
+        resps = self.client.fire_pipeline([Command("ECHO", ["a"]), Command("RESET"), Command("ECHO", ["b"])])
+        self.assertEqual(resps[0].v_str, "ECHO a")
+        self.assertTrue(resps[1].err)
+        self.assertTrue(resps[2].err)
+
+        self.assertEqual(self.fire_quietly(Command("ECHO", ["c"])).v_str, "ECHO c")
+        self.assertTrue(self.client.is_connected())
+
+    def test_closed_client(self):
+        self.client.close()
+        self.assertEqual(self.client.fire(Command("PING")).err, "Client is closed")
+        self.assertFalse(self.client.is_connected())
+
+    def test_watch_stop_event_ends_watch_thread(self):
+        stop = self.client.open_watch_channel()
+        stop.set()
+        self.client._watch_thread.join(2)
+        self.assertFalse(self.client._watch_thread.is_alive())
+        self.assertEqual(self.client.fire(Command("ECHO", ["a"])).v_str, "ECHO a")
+
+    def watch_next_in_thread(self):
+        """Start a thread blocked in watch_next(), collecting what it returns."""
+        results = []
+        thread = threading.Thread(target=lambda: results.append(self.client.watch_next()), daemon=True)
+        thread.start()
+        # Give it time to block on an empty channel
+        time.sleep(0.1)
+        return thread, results
+
+    def test_watch_stop_wakes_watch_next(self):
+        stop = self.client.open_watch_channel()
+        thread, results = self.watch_next_in_thread()
+        stop.set()
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(results, [None])
+        self.assertIsNone(self.client.watch_next())
+
+    def test_close_wakes_watch_next(self):
+        self.client.open_watch_channel()
+        thread, results = self.watch_next_in_thread()
+        self.client.close()
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(results, [None])
+
+    def test_reopen_stopped_watch_channel(self):
+        stop = self.client.open_watch_channel()
+        stop.set()
+        reopened = self.client.open_watch_channel()
+        self.assertIsNot(reopened, stop)
+        self.assertFalse(reopened.is_set())
+        self.assertTrue(self.client._watch_thread.is_alive())
+        self.assertIsNone(self.client.watch_next(0.05))
+        self.assertEqual([args for cmd, args in self.server.commands if cmd == "HANDSHAKE"].count(
+            [self.client.id, "watch"]), 2)
+
+
+class ThreadSafeClientTest(_ClientTests, unittest.TestCase):
+    thread_safe = True
+
+    def test_concurrent_fire(self):
+        errors = []
+
+        def work(worker):
+            for i in range(200):
+                if i % 10:
+                    expected = [f"ECHO {worker} {i}"]
+                    resps = [self.client.fire(Command("ECHO", [str(worker), str(i)]))]
+                else:
+                    expected = [f"ECHO {worker} {i} {j}" for j in range(3)]
+                    resps = self.client.fire_pipeline(
+                        [Command("ECHO", [str(worker), str(i), str(j)]) for j in range(3)])
+                if [resp.v_str for resp in resps] != expected:
+                    errors.append((expected, resps))
+
+        threads = [threading.Thread(target=work, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+class SingleThreadedClientTest(_ClientTests, unittest.TestCase):
+    thread_safe = False
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file